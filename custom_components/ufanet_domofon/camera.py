@@ -1,15 +1,18 @@
 """Camera platform for Ufanet Domofon."""
 
+import asyncio
 import logging
 
+import aiohttp
+
 from homeassistant.components.camera import Camera, CameraEntityDescription, CameraEntityFeature
-from homeassistant.components.camera.const import StreamType
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, SNAPSHOT_TIMEOUT
 from .coordinator import UfanetDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -45,7 +48,6 @@ class UfanetCamera(CoordinatorEntity, Camera):
 
     _attr_has_entity_name = True
     _attr_supported_features = CameraEntityFeature.STREAM
-    _attr_frontend_stream_type = StreamType.HLS
     _attr_motion_detection_enabled = False
 
     entity_description = CameraEntityDescription(
@@ -62,11 +64,51 @@ def __init__(self, coordinator, camera_data):
         self._number = camera_data.get("number")
         self._unique_id = f"ufanet_camera_{self._number}"
         self._attr_unique_id = self._unique_id
+        self._snapshot_ok = False
+
+    async def async_added_to_hass(self) -> None:
+        """Check once whether the server thumbnail can serve stills."""
+        await super().async_added_to_hass()
+        if self._camera_data.get("snapshot_url"):
+            self.hass.async_create_background_task(
+                self._async_probe_snapshot(), f"ufanet_domofon snapshot probe {self._number}"
+            )
 
     @property
     def use_stream_for_stills(self) -> bool:
-        """Use stream to generate stills."""
-        return True
+        """Use stream to generate stills until the snapshot URL is known to work."""
+        return not self._snapshot_ok
+
+    async def _async_fetch_snapshot(self) -> bytes | None:
+        """Fetch the server thumbnail, returning None if it is not a JPEG image."""
+        session = async_get_clientsession(self.hass)
+        try:
+            # Keep most of HA's 10 s image budget for the stream
+            async with asyncio.timeout(SNAPSHOT_TIMEOUT):
+                async with session.get(self._camera_data["snapshot_url"]) as response:
+                    response.raise_for_status()
+                    if response.content_type == "image/jpeg":
+                        return await response.read()
+                    _LOGGER.debug("Snapshot for camera %s returned %s", self._number, response.content_type)
+        except aiohttp.ClientResponseError as err:
+            # The error text includes the tokenized URL, log the status only
+            _LOGGER.debug("Snapshot failed for camera %s (HTTP %s)", self._number, err.status)
+        except (TimeoutError, aiohttp.ClientError) as err:
+            _LOGGER.debug("Snapshot failed for camera %s (%s)", self._number, type(err).__name__)
+        return None
+
+    async def _async_probe_snapshot(self) -> None:
+        """Serve stills from the thumbnail only if it answers with a JPEG."""
+        self._snapshot_ok = await self._async_fetch_snapshot() is not None
+        _LOGGER.debug("Snapshot for camera %s %s", self._number, "enabled" if self._snapshot_ok else "disabled")
+
+    async def async_camera_image(self, width: int | None = None, height: int | None = None) -> bytes | None:
+        """Return a still image from the server thumbnail."""
+        image = await self._async_fetch_snapshot()
+        if image is None:
+            # Hand stills back to the stream for the rest of the session
+            self._snapshot_ok = False
+        return image
 
     async def stream_source(self) -> str | None:
         """Return the stream source."""
@@ -3,6 +3,7 @@
 DOMAIN = "ufanet_domofon"
 DEFAULT_NAME = "Ufanet Domofon"
 SCAN_INTERVAL = 24  # hours
+SNAPSHOT_TIMEOUT = 2  # seconds
 
 # API endpoints
 BASE_URL = "https://dom.ufanet.ru/"
@@ -11,6 +12,13 @@
 OPEN_DOOR_ENDPOINT = "api/v0/skud/shared/{id}/open/"
 CAMERAS_ENDPOINT = "api/v1/cctv"
 CONTRACT_ENDPOINT = "api/v0/contract/"
+CONTRACT_HISTORY_ENDPOINT = "api/v0/contract/{id}/history/"
+HISTORY_MAX_PAGES = 100
+
+# Contract history record fields
+HISTORY_DATE = "date"
+HISTORY_AMOUNT = "amount"
+HISTORY_BALANCE = "balance"
 
 # Configuration keys
 CONF_CONTRACT = "contract"
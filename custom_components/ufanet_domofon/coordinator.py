@@ -6,11 +6,26 @@
 
 import aiohttp
 
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticMeanType, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics, get_last_statistics
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-
-from .const import AUTH_ENDPOINT, BASE_URL, CAMERAS_ENDPOINT, CONTRACT_ENDPOINT, DOMOFONS_ENDPOINT, SCAN_INTERVAL
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import (
+    AUTH_ENDPOINT,
+    BASE_URL,
+    CAMERAS_ENDPOINT,
+    CONTRACT_ENDPOINT,
+    CONTRACT_HISTORY_ENDPOINT,
+    DOMAIN,
+    DOMOFONS_ENDPOINT,
+    HISTORY_MAX_PAGES,
+    SCAN_INTERVAL,
+)
+from .statistics import build_contract_statistics, history_page_is_imported
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +52,7 @@ def __init__(self, hass: HomeAssistant, entry: ConfigEntry):
         self.all_cameras = []
         self.domofons_cameras = {}
         self.standalone_cameras = []
+        self._history_unsupported = False
 
     async def _async_login(self):
         """Authenticate and get access token."""
@@ -98,7 +114,7 @@ async def _fetch_contracts(self):
             self.contracts = []
 
     async def _fetch_cameras(self):
-        """Fetch cameras list and generate RTSP URLs."""
+        """Fetch cameras list and generate RTSP and snapshot URLs."""
         try:
             headers = await self._get_headers()
             async with self._session.get(f"{BASE_URL}{CAMERAS_ENDPOINT}", headers=headers) as response:
@@ -115,6 +131,10 @@ async def _fetch_cameras(self):
                     if domain and token_l and number:
                         rtsp_url = f"rtsp://{domain}/{number}?token={token_l}"
                         camera["stream_source"] = rtsp_url
+                        # Server-side JPEG thumbnail, avoids opening the stream for stills.
+                        # The preview path is assumed, not documented by Ufanet; the camera
+                        # probes it once and keeps stills on the stream unless it works.
+                        camera["snapshot_url"] = f"https://{domain}/{number}/preview.jpg?token={token_l}"
 
                     self.all_cameras.append(camera)
 
@@ -124,6 +144,128 @@ async def _fetch_cameras(self):
             _LOGGER.error("Failed to fetch cameras: %s", err)
             self.all_cameras = []
 
+    async def _fetch_contract_history(self, contract_id, since=None):
+        """Fetch billing history (payments and charges) for a contract.
+
+        Paginated responses are followed through "next" until a page reaches
+        records older than since. Returns None if the history is unavailable.
+        """
+        url = f"{BASE_URL}{CONTRACT_HISTORY_ENDPOINT.format(id=contract_id)}"
+        history = []
+        try:
+            headers = await self._get_headers()
+            for _ in range(HISTORY_MAX_PAGES):
+                async with self._session.get(url, headers=headers) as response:
+                    if response.status in (404, 405, 501):
+                        # Not offered for this account, don't ask again this session
+                        _LOGGER.debug("Contract history not supported (%s), disabling import", response.status)
+                        self._history_unsupported = True
+                        return None
+                    response.raise_for_status()
+                    page = await response.json()
+
+                if not isinstance(page, dict):
+                    history.extend(page)
+                    break
+
+                records = page.get("results", [])
+                history.extend(records)
+                url = page.get("next")
+                if not url or history_page_is_imported(records, since):
+                    break
+            else:
+                _LOGGER.warning("Contract %s history truncated at %s pages", contract_id, HISTORY_MAX_PAGES)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.error("Failed to fetch history for contract %s: %s", contract_id, err)
+            return None
+
+        _LOGGER.debug("Fetched %s history records for contract %s", len(history), contract_id)
+        return history
+
+    async def _async_last_statistic(self, statistic_id):
+        """Return the last imported statistics row for statistic_id, if any."""
+        last_stats = await get_instance(self.hass).async_add_executor_job(
+            get_last_statistics, self.hass, 1, statistic_id, True, {"state", "sum"}
+        )
+        rows = last_stats.get(statistic_id)
+        return rows[0] if rows else None
+
+    async def _async_import_contract_statistics(self, contract):
+        """Import balance and charge history of a contract as external statistics.
+
+        Only complete hours newer than the last imported row are written, so
+        each sync adds one batch per statistic instead of rewriting history.
+        """
+        contract_id = contract.get("id")
+        if contract_id is None:
+            return
+
+        # Statistic ids only allow lowercase letters, digits and underscores
+        balance_id = f"{DOMAIN}:contract_{slugify(str(contract_id))}_balance"
+        charges_id = f"{DOMAIN}:contract_{slugify(str(contract_id))}_charges"
+
+        last_balance = await self._async_last_statistic(balance_id)
+        last_charges = await self._async_last_statistic(charges_id)
+
+        # Records before the end of the older of the two last imported hours are known
+        starts = [row["start"] for row in (last_balance, last_charges) if row]
+        since = dt_util.utc_from_timestamp(min(starts)) + timedelta(hours=1) if len(starts) == 2 else None
+
+        history = await self._fetch_contract_history(contract_id, since)
+        if history is None:
+            return
+
+        balance_stats, charges_stats = build_contract_statistics(
+            history, dt_util.utcnow(), last_balance, last_charges
+        )
+
+        title = contract.get("title", contract_id)
+        if balance_stats:
+            async_add_external_statistics(
+                self.hass,
+                StatisticMetaData(
+                    mean_type=StatisticMeanType.ARITHMETIC,
+                    has_sum=False,
+                    name=f"Баланс {title}",
+                    source=DOMAIN,
+                    statistic_id=balance_id,
+                    unit_class=None,
+                    unit_of_measurement="RUB",
+                ),
+                balance_stats,
+            )
+        if charges_stats:
+            async_add_external_statistics(
+                self.hass,
+                StatisticMetaData(
+                    mean_type=StatisticMeanType.NONE,
+                    has_sum=True,
+                    name=f"Списания {title}",
+                    source=DOMAIN,
+                    statistic_id=charges_id,
+                    unit_class=None,
+                    unit_of_measurement="RUB",
+                ),
+                charges_stats,
+            )
+
+        _LOGGER.debug(
+            "Imported %s balance and %s charge statistics for contract %s",
+            len(balance_stats),
+            len(charges_stats),
+            contract_id,
+        )
+
+    async def _async_import_statistics(self):
+        """Import billing history of all contracts into long-term statistics."""
+        for contract in self.contracts:
+            if self._history_unsupported:
+                return
+            try:
+                await self._async_import_contract_statistics(contract)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.error("Failed to import statistics for contract %s: %s", contract.get("id"), err)
+
     def _map_cameras_to_domofons(self):
         """Map cameras to domofons based on cctv_number."""
         self.domofons_cameras = {}
@@ -161,6 +303,9 @@ async def _async_update_data(self):
             # Map cameras to domofons
             self._map_cameras_to_domofons()
 
+            # Push billing history to the recorder
+            await self._async_import_statistics()
+
         except Exception as err:  # noqa: BLE001
             _LOGGER.error("Error updating data: %s", err)
             raise UpdateFailed(f"Error updating data: {err}")  # noqa: B904
@@ -0,0 +1,146 @@
+"""Conversion of Ufanet billing history into long-term statistics."""
+
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.components.recorder.models import StatisticData
+from homeassistant.util import dt as dt_util
+
+from .const import HISTORY_AMOUNT, HISTORY_BALANCE, HISTORY_DATE
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR = timedelta(hours=1)
+
+
+def _parse_record(record):
+    """Return (created, balance, amount) for a history record, or None if malformed."""
+    try:
+        created = dt_util.parse_datetime(str(record.get(HISTORY_DATE, "")))
+        balance = float(record[HISTORY_BALANCE]) if record.get(HISTORY_BALANCE) is not None else None
+        amount = float(record[HISTORY_AMOUNT]) if record.get(HISTORY_AMOUNT) is not None else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+    if created is None:
+        return None
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=dt_util.get_default_time_zone())
+    return dt_util.as_utc(created), balance, amount
+
+
+def _start_of_hour(value: datetime) -> datetime:
+    """Return the start of the UTC hour value falls in."""
+    return dt_util.as_utc(value).replace(minute=0, second=0, microsecond=0)
+
+
+def history_page_is_imported(records: list, since: datetime | None) -> bool:
+    """Return True if a newest-first history page already reaches imported data.
+
+    Pages in oldest-first order never stop the walk, since newer records are
+    still to come on the following pages.
+    """
+    if since is None:
+        return False
+    dates = [parsed[0] for parsed in map(_parse_record, records) if parsed is not None]
+    if len(dates) < 2 or dates[0] <= dates[-1]:
+        return False
+    return dates[-1] < since
+
+
+def _balance_row(hour: datetime, carried: float | None, changes: list) -> StatisticData | None:
+    """Return the time-weighted balance row for one hour.
+
+    carried is the balance at the start of the hour, changes are the
+    (created, balance) pairs recorded within it in chronological order.
+    """
+    value = carried
+    since = hour
+    weighted = 0.0
+    duration = 0.0
+    values = [] if carried is None else [carried]
+    for created, balance in changes:
+        if value is not None:
+            seconds = (created - since).total_seconds()
+            weighted += value * seconds
+            duration += seconds
+        value = balance
+        since = created
+        values.append(balance)
+
+    if value is None:
+        return None
+
+    seconds = (hour + HOUR - since).total_seconds()
+    weighted += value * seconds
+    duration += seconds
+    return StatisticData(
+        start=hour,
+        state=value,
+        mean=weighted / duration if duration else value,
+        min=min(values),
+        max=max(values),
+    )
+
+
+def build_contract_statistics(
+    history: list[dict],
+    now: datetime,
+    last_balance: dict | None = None,
+    last_charges: dict | None = None,
+) -> tuple[list[StatisticData], list[StatisticData]]:
+    """Convert billing history into hourly balance and charge statistics.
+
+    last_balance and last_charges are the last rows already in the recorder
+    (as returned by get_last_statistics). Only complete hours after them are
+    returned. The balance is carried forward so every hour gets a row, and
+    the charge sum continues from the last imported row.
+    """
+    current_hour = _start_of_hour(now)
+    balance_since = last_balance["start"] if last_balance else None
+    charges_since = last_charges["start"] if last_charges else None
+    charges_sum = (last_charges.get("sum") or 0.0) if last_charges else 0.0
+
+    # Group records by the hour they belong to
+    hours = {}
+    for record in history:
+        parsed = _parse_record(record)
+        if parsed is None:
+            _LOGGER.debug("Skipping malformed history record: %s", record)
+            continue
+        hour = _start_of_hour(parsed[0])
+        # The current hour may still receive records, import it on a later sync
+        if hour >= current_hour:
+            continue
+        hours.setdefault(hour, []).append(parsed)
+    for records in hours.values():
+        records.sort(key=lambda item: item[0])
+
+    charges_stats = []
+    for hour in sorted(hours):
+        if charges_since is not None and hour.timestamp() <= charges_since:
+            continue
+        charged = sum(-amount for _, _, amount in hours[hour] if amount is not None and amount < 0)
+        charges_sum += charged
+        charges_stats.append(StatisticData(start=hour, state=charged, sum=charges_sum))
+
+    # Walk every hour after the last imported one, carrying the balance over empty hours
+    balance_stats = []
+    if balance_since is not None:
+        hour = dt_util.utc_from_timestamp(balance_since) + HOUR
+        carried = last_balance.get("state")
+    elif hours:
+        hour = min(hours)
+        carried = None
+    else:
+        return balance_stats, charges_stats
+
+    while hour < current_hour:
+        changes = [(created, balance) for created, balance, _ in hours.get(hour, []) if balance is not None]
+        row = _balance_row(hour, carried, changes)
+        if row is not None:
+            balance_stats.append(row)
+            carried = row["state"]
+        hour += HOUR
+
+    return balance_stats, charges_stats
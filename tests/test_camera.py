@@ -0,0 +1,107 @@
+"""Tests for the Ufanet camera still images."""
+
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+from custom_components.ufanet_domofon.camera import UfanetCamera
+
+SNAPSHOT_URL = "https://cam.example/1234/preview.jpg?token=secret-token"
+
+
+def _camera(snapshot_url: str | None = SNAPSHOT_URL) -> UfanetCamera:
+    """Return a camera entity with a mocked hass."""
+    camera_data = {"number": "1234", "stream_source": "rtsp://cam.example/1234?token=secret-token"}
+    if snapshot_url:
+        camera_data["snapshot_url"] = snapshot_url
+    camera = UfanetCamera(MagicMock(), camera_data)
+    camera.hass = MagicMock()
+    return camera
+
+
+def _session(response=None, side_effect=None) -> MagicMock:
+    """Return a client session whose get() yields response or raises side_effect."""
+    request = MagicMock()
+    request.__aenter__ = AsyncMock(return_value=response, side_effect=side_effect)
+    request.__aexit__ = AsyncMock(return_value=False)
+    session = MagicMock()
+    session.get.return_value = request
+    return session
+
+
+def _response(content_type: str = "image/jpeg", body: bytes = b"\xff\xd8jpeg") -> MagicMock:
+    """Return a successful response with the given content type."""
+    response = MagicMock()
+    response.content_type = content_type
+    response.read = AsyncMock(return_value=body)
+    return response
+
+
+@pytest.mark.unit
+def test_stills_use_stream_by_default():
+    """Stills stay on the stream until the snapshot is known to work."""
+    assert _camera().use_stream_for_stills
+    assert _camera(snapshot_url=None).use_stream_for_stills
+
+
+@pytest.mark.unit
+async def test_probe_enables_jpeg_snapshot():
+    """A JPEG answer switches stills to the server thumbnail."""
+    camera = _camera()
+    session = _session(_response())
+
+    with patch("custom_components.ufanet_domofon.camera.async_get_clientsession", return_value=session):
+        await camera._async_probe_snapshot()
+        image = await camera.async_camera_image()
+
+    assert not camera.use_stream_for_stills
+    assert image == b"\xff\xd8jpeg"
+
+
+@pytest.mark.unit
+async def test_non_jpeg_response_keeps_stream():
+    """An HTML page with status 200 is not served as the camera image."""
+    camera = _camera()
+    session = _session(_response(content_type="text/html", body=b"<html>login</html>"))
+
+    with patch("custom_components.ufanet_domofon.camera.async_get_clientsession", return_value=session):
+        await camera._async_probe_snapshot()
+
+    assert camera.use_stream_for_stills
+
+
+@pytest.mark.unit
+async def test_http_error_logs_status_without_token(caplog):
+    """HTTP errors are logged by status only, the token stays out of the log."""
+    caplog.set_level(logging.DEBUG)
+    camera = _camera()
+    request_info = MagicMock(real_url=SNAPSHOT_URL, url=SNAPSHOT_URL)
+    response = _response()
+    response.raise_for_status.side_effect = aiohttp.ClientResponseError(request_info, (), status=404)
+
+    with patch(
+        "custom_components.ufanet_domofon.camera.async_get_clientsession", return_value=_session(response)
+    ):
+        await camera._async_probe_snapshot()
+
+    assert camera.use_stream_for_stills
+    assert "HTTP 404" in caplog.text
+    assert "secret-token" not in caplog.text
+
+
+@pytest.mark.unit
+async def test_failure_falls_back_to_stream():
+    """A failing snapshot hands later stills back to the stream."""
+    camera = _camera()
+    camera._snapshot_ok = True
+
+    with patch(
+        "custom_components.ufanet_domofon.camera.async_get_clientsession",
+        return_value=_session(side_effect=TimeoutError),
+    ):
+        image = await camera.async_camera_image()
+
+    assert image is None
+    assert camera.use_stream_for_stills
@@ -0,0 +1,146 @@
+"""Tests for the billing history to statistics conversion."""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.ufanet_domofon.statistics import build_contract_statistics, history_page_is_imported
+
+NOW = datetime(2026, 10, 19, 12, 30, tzinfo=UTC)
+
+
+def _hour(hour: int) -> datetime:
+    """Return the start of an hour on the test day."""
+    return datetime(2026, 10, 19, hour, tzinfo=UTC)
+
+
+@pytest.mark.unit
+def test_aware_timestamps_are_bucketed_by_hour():
+    """Records are grouped by UTC hour and the balance is time weighted."""
+    history = [
+        {"date": "2026-10-19T09:00:00+00:00", "amount": -30, "balance": 170},
+        {"date": "2026-10-19T09:30:00+00:00", "amount": -20, "balance": 150},
+        {"date": "2026-10-19T10:05:00+03:00", "amount": 100, "balance": 250},
+    ]
+
+    balance, charges = build_contract_statistics(history, NOW)
+
+    assert [row["start"] for row in charges] == [_hour(7), _hour(9)]
+    assert [row["sum"] for row in charges] == [0, 50]
+    row = next(row for row in balance if row["start"] == _hour(9))
+    assert row["state"] == 150
+    assert row["mean"] == 160
+    assert row["min"] == 150
+    assert row["max"] == 250
+
+
+@pytest.mark.unit
+def test_balance_is_carried_over_empty_hours():
+    """Every complete hour up to now gets a balance row."""
+    history = [{"date": "2026-10-19T08:45:00+00:00", "amount": -10, "balance": 90}]
+
+    balance, _ = build_contract_statistics(history, NOW)
+
+    assert [row["start"] for row in balance] == [_hour(8), _hour(9), _hour(10), _hour(11)]
+    assert [row["state"] for row in balance] == [90, 90, 90, 90]
+    assert balance[1]["mean"] == balance[1]["min"] == balance[1]["max"] == 90
+
+
+@pytest.mark.unit
+def test_naive_timestamps_use_default_time_zone(monkeypatch):
+    """Naive timestamps are interpreted in the configured time zone."""
+    tz = timezone(timedelta(hours=5))
+    monkeypatch.setattr("homeassistant.util.dt.get_default_time_zone", lambda: tz)
+    history = [{"date": "2026-10-19T14:15:00", "amount": -10, "balance": 90}]
+
+    balance, charges = build_contract_statistics(history, NOW)
+
+    assert balance[0]["start"] == _hour(9)
+    assert charges[0]["start"] == _hour(9)
+    assert charges[0]["sum"] == 10
+
+
+@pytest.mark.unit
+def test_current_hour_is_deferred():
+    """Records in the still open hour are left for the next sync."""
+    history = [
+        {"date": "2026-10-19T11:59:00+00:00", "amount": -5, "balance": 95},
+        {"date": "2026-10-19T12:01:00+00:00", "amount": -5, "balance": 90},
+    ]
+
+    balance, charges = build_contract_statistics(history, NOW)
+
+    assert [row["start"] for row in balance] == [_hour(11)]
+    assert balance[0]["state"] == 95
+    assert [row["start"] for row in charges] == [_hour(11)]
+
+
+@pytest.mark.unit
+def test_resumed_import_continues_from_last_rows():
+    """Only hours after the last rows are returned, balance and sum carry over."""
+    history = [
+        {"date": "2026-10-19T08:30:00+00:00", "amount": -40, "balance": 60},
+        {"date": "2026-10-19T10:30:00+00:00", "amount": -15, "balance": 45},
+    ]
+
+    balance, charges = build_contract_statistics(
+        history,
+        NOW,
+        last_balance={"start": _hour(8).timestamp(), "state": 60.0},
+        last_charges={"start": _hour(8).timestamp(), "sum": 200.0},
+    )
+
+    assert [row["start"] for row in balance] == [_hour(9), _hour(10), _hour(11)]
+    assert balance[0]["state"] == 60
+    assert balance[1]["mean"] == 52.5
+    assert balance[1]["max"] == 60
+    assert [row["start"] for row in charges] == [_hour(10)]
+    assert charges[0]["state"] == 15
+    assert charges[0]["sum"] == 215
+
+
+@pytest.mark.unit
+def test_payment_only_hour_adds_no_charge():
+    """An hour with only payments keeps the charge sum unchanged."""
+    history = [
+        {"date": "2026-10-19T09:00:00+00:00", "amount": -25, "balance": 75},
+        {"date": "2026-10-19T10:00:00+00:00", "amount": 500, "balance": 575},
+    ]
+
+    balance, charges = build_contract_statistics(history, NOW)
+
+    assert balance[1]["state"] == 575
+    assert charges[1]["state"] == 0
+    assert charges[1]["sum"] == 25
+
+
+@pytest.mark.unit
+def test_malformed_records_are_skipped():
+    """Bad dates and non-numeric values skip only the affected record."""
+    history = [
+        {"date": "not a date", "amount": -1, "balance": 1},
+        {"date": "2026-10-19T09:00:00+00:00", "amount": "n/a", "balance": 10},
+        {"date": "2026-10-19T09:10:00+00:00", "amount": -5, "balance": "oops"},
+        "garbage",
+        {"date": "2026-10-19T09:20:00+00:00", "amount": -5, "balance": 95},
+    ]
+
+    balance, charges = build_contract_statistics(history, NOW)
+
+    assert balance[0]["state"] == 95
+    assert len(charges) == 1
+    assert charges[0]["sum"] == 5
+
+
+@pytest.mark.unit
+def test_history_page_is_imported():
+    """Only newest-first pages reaching imported data stop the walk."""
+    newest_first = [
+        {"date": "2026-10-19T10:00:00+00:00"},
+        {"date": "2026-10-19T07:00:00+00:00"},
+    ]
+
+    assert history_page_is_imported(newest_first, _hour(8))
+    assert not history_page_is_imported(newest_first, _hour(6))
+    assert not history_page_is_imported(list(reversed(newest_first)), _hour(8))
+    assert not history_page_is_imported(newest_first, None)